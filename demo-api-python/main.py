@@ -6,11 +6,16 @@ so the VAC sidecar can use this as upstream. Used for testing and as a
 Backend (FastAPI) showcase.
 """
 
+import hmac
 import os
-import uuid
+import re
+import secrets
 from typing import Any, Optional
 
-from fastapi import FastAPI, Header, HTTPException, Depends
+import msgspec
+import orjson
+from fastapi import FastAPI, Header, HTTPException, Depends, Request, Response
+from fastapi.exceptions import RequestValidationError
 from pydantic import BaseModel
 
 app = FastAPI(
@@ -22,6 +27,7 @@ app = FastAPI(
 # Config from env (same as Rust: DEMO_API_KEY, DEMO_API_PORT)
 API_KEY = os.environ.get("DEMO_API_KEY", "demo-api-key")
 PORT = int(os.environ.get("DEMO_API_PORT", "8080"))
+_API_KEY_BYTES = API_KEY.encode()
 
 
 # --- Request/Response models (match Rust demo-api) ---
@@ -32,21 +38,68 @@ class ApiResponse(BaseModel):
     data: Optional[Any] = None
 
 
-class SearchRequest(BaseModel):
+# Request bodies are msgspec Structs decoded straight from the raw JSON bytes
+# (see json_body) instead of Pydantic models.
+
+class SearchRequest(msgspec.Struct):
     query: str
 
 
-class ChargeRequest(BaseModel):
+class ChargeRequest(msgspec.Struct):
     amount: int
     currency: str
     description: Optional[str] = None
 
 
+_MISSING_FIELD = re.compile(r"Object missing required field `([^`]+)`")
+_PATH_PART = re.compile(r"\.([^.\[]+)|\[(\d+)\]")
+
+
+def _validation_error(e: msgspec.DecodeError) -> dict:
+    """Translate a msgspec error into one FastAPI-style validation error entry."""
+    msg = str(e)
+    if not isinstance(e, msgspec.ValidationError):
+        return {"loc": ["body"], "msg": msg, "type": "json_invalid"}
+    text, _, at = msg.partition(" - at `$")
+    loc: list = ["body"]
+    for key, index in _PATH_PART.findall(at.rstrip("`")):
+        loc.append(key if key else int(index))
+    missing = _MISSING_FIELD.match(text)
+    if missing:
+        loc.append(missing.group(1))
+        return {"loc": loc, "msg": "Field required", "type": "missing"}
+    return {"loc": loc, "msg": text, "type": "value_error"}
+
+
+def json_body(model: type):
+    """Dependency that decodes the request body into `model`.
+    Invalid JSON or shape returns 422 with FastAPI's {"detail": [{"loc", "msg", "type"}]} body.
+    """
+    decoder = msgspec.json.Decoder(model)
+
+    async def decode(request: Request):
+        try:
+            return decoder.decode(await request.body())
+        except msgspec.DecodeError as e:  # includes ValidationError
+            raise RequestValidationError([_validation_error(e)])
+
+    return decode
+
+
+def json_body_doc(model: type) -> dict:
+    """openapi_extra documenting `model` as the JSON request body (json_body bypasses FastAPI's schema)."""
+    schema = msgspec.json.schema(model)
+    # Flat Structs: inline the single definition instead of a dangling $defs reference
+    schema = schema.get("$defs", {}).get(model.__name__, schema)
+    return {"requestBody": {"required": True, "content": {"application/json": {"schema": schema}}}}
+
+
 def verify_api_key(authorization: Optional[str] = Header(None)) -> None:
-    if not authorization or not authorization.startswith("Bearer "):
+    if not authorization or authorization[:7] != "Bearer ":
         raise HTTPException(status_code=401, detail="Unauthorized")
-    token = authorization[7:].strip()
-    if token != API_KEY:
+    # No strip(): like the Rust demo-api, the token is everything after "Bearer ".
+    # Constant-time compare so response timing doesn't leak the key
+    if not hmac.compare_digest(authorization[7:].encode(), _API_KEY_BYTES):
         raise HTTPException(status_code=401, detail="Unauthorized")
 
 
@@ -61,53 +114,68 @@ async def root():
     }
 
 
-@app.get("/health", response_model=ApiResponse)
+# Handlers build ApiResponse-shaped dicts and serialize them with orjson
+# directly: the server constructs this data itself, so response_model
+# validation is skipped. ApiResponse is still declared under `responses`
+# for the OpenAPI docs.
+_API_RESPONSE_DOC = {200: {"model": ApiResponse}}
+
+
+def orjson_response(content: Any) -> Response:
+    """JSON response encoded with orjson."""
+    return Response(orjson.dumps(content), media_type="application/json")
+
+
+@app.get("/health", responses=_API_RESPONSE_DOC)
 async def health():
     """Health check (no auth required)."""
-    return ApiResponse(success=True, message="Demo API is healthy", data=None)
+    return orjson_response({"success": True, "message": "Demo API is healthy", "data": None})
 
 
-@app.post("/search", response_model=ApiResponse)
+@app.post("/search", responses=_API_RESPONSE_DOC, openapi_extra=json_body_doc(SearchRequest))
 async def search(
-    payload: SearchRequest,
     _: None = Depends(verify_api_key),
+    payload: SearchRequest = Depends(json_body(SearchRequest)),
 ):
     """Search endpoint (requires API key). Sidecar injects Bearer token."""
     results = [
         {"id": "1", "title": f"Result for: {payload.query}", "score": 0.95},
         {"id": "2", "title": f"Another result for: {payload.query}", "score": 0.87},
     ]
-    return ApiResponse(
-        success=True,
-        message=f"Found {len(results)} results",
-        data={
+    return orjson_response({
+        "success": True,
+        "message": f"Found {len(results)} results",
+        "data": {
             "results": results,
             "count": len(results),
             "query": payload.query,
         },
-    )
+    })
 
 
-@app.post("/charge", response_model=ApiResponse)
+@app.post("/charge", responses=_API_RESPONSE_DOC, openapi_extra=json_body_doc(ChargeRequest))
 async def charge(
-    payload: ChargeRequest,
     _: None = Depends(verify_api_key),
+    payload: ChargeRequest = Depends(json_body(ChargeRequest)),
 ):
     """Charge endpoint (requires API key). Sidecar injects Bearer token."""
-    charge_id = f"ch_{uuid.uuid4().hex}"
-    return ApiResponse(
-        success=True,
-        message="Charge processed successfully",
-        data={
+    charge_id = "ch_" + secrets.token_hex(16)
+    return orjson_response({
+        "success": True,
+        "message": "Charge processed successfully",
+        "data": {
             "id": charge_id,
             "amount": payload.amount,
             "currency": payload.currency,
             "status": "succeeded",
             "description": payload.description,
         },
-    )
+    })
 
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=PORT)
+    # uvloop + httptools (from uvicorn[standard]); uvloop has no Windows support
+    loop = "asyncio" if sys.platform == "win32" else "uvloop"
+    uvicorn.run(app, host="0.0.0.0", port=PORT, loop=loop, http="httptools")
@@ -1,15 +1,19 @@
 """
 LangGraph + VAC Example
 
-Minimal LangGraph workflow where each node calls the VAC sidecar. Receipts
-auto-accumulate on the client, so search -> charge enforces policy (e.g. charge
-only after search). Run with sidecar + control-plane + demo-api (or demo-api-python)
-and a valid ROOT_BISCUIT.
+Minimal LangGraph workflow where each node calls the VAC sidecar. Nodes are
+async (AsyncVACClient) so sidecar round-trips don't block the event loop:
+two searches fan out in parallel, then join at charge. Receipts
+auto-accumulate on the client, so search -> charge enforces policy
+(e.g. charge only after search). Run with sidecar + control-plane + demo-api
+(or demo-api-python) and a valid ROOT_BISCUIT.
 """
 
+import asyncio
+import operator
 import os
 import sys
-from typing import TypedDict
+from typing import Annotated, List, TypedDict
 
 # Add sdks/python so we can import vac_client from repo root or examples/
 _REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
@@ -17,43 +21,52 @@ _SDK = os.path.join(_REPO_ROOT, "sdks", "python")
 if _SDK not in sys.path:
     sys.path.insert(0, _SDK)
 
-from vac_client import VACClient, VACError
+from vac_client import AsyncVACClient, VACError
 
 
 class State(TypedDict, total=False):
-    """Graph state: query, amount, and response/error strings."""
+    """Graph state: queries, amount, response strings, and accumulated errors."""
     query: str
+    alt_query: str
     amount: int
     search_response: str
+    alt_search_response: str
     charge_response: str
-    error: str
+    # Parallel search nodes may both report, so errors are merged, not overwritten
+    errors: Annotated[List[str], operator.add]
 
 
-def make_search_node(vac: VACClient):
-    def search_node(state: State) -> State:
-        query = state.get("query", "flights to NYC")
+def make_search_node(vac: AsyncVACClient, query_key: str, response_key: str):
+    async def search_node(state: State) -> State:
+        query = state.get(query_key, "flights to NYC")
         try:
-            resp = vac.get("/search", params={"q": query})
-            return {"search_response": resp.text, "error": "" if resp.ok else resp.text}
+            resp = await vac.get("/search", params={"q": query})
+            out: State = {response_key: resp.text}
+            if not resp.ok:
+                out["errors"] = [resp.text]
+            return out
         except Exception as e:
-            return {"error": str(e)}
+            return {"errors": [str(e)]}
     return search_node
 
 
-def make_charge_node(vac: VACClient):
-    def charge_node(state: State) -> State:
+def make_charge_node(vac: AsyncVACClient):
+    async def charge_node(state: State) -> State:
         amount = state.get("amount", 35000)
         try:
-            resp = vac.post("/charge", json={"amount": amount, "currency": "usd"})
-            return {"charge_response": resp.text, "error": "" if resp.ok else resp.text}
+            resp = await vac.post("/charge", json={"amount": amount, "currency": "usd"})
+            out: State = {"charge_response": resp.text}
+            if not resp.ok:
+                out["errors"] = [resp.text]
+            return out
         except VACError as e:
-            return {"error": f"VACError: {e.message}", "charge_response": ""}
+            return {"errors": [f"VACError: {e.message}"], "charge_response": ""}
         except Exception as e:
-            return {"error": str(e)}
+            return {"errors": [str(e)]}
     return charge_node
 
 
-def main():
+async def main():
     sidecar_url = os.environ.get("VAC_SIDECAR_URL", "http://localhost:3000")
     root_biscuit = os.environ.get("ROOT_BISCUIT", os.environ.get("VAC_ROOT_BISCUIT", ""))
     if not root_biscuit:
@@ -61,34 +74,42 @@ def main():
         return
 
     try:
-        from langgraph.graph import StateGraph, END
+        from langgraph.graph import StateGraph, START, END
     except ImportError:
         print("Install LangGraph: pip install langgraph")
         return
 
-    vac = VACClient(sidecar_url=sidecar_url, root_biscuit=root_biscuit)
+    vac = AsyncVACClient(sidecar_url=sidecar_url, root_biscuit=root_biscuit)
     graph = StateGraph(State)
-    graph.add_node("search", make_search_node(vac))
+    graph.add_node("search_a", make_search_node(vac, "query", "search_response"))
+    graph.add_node("search_b", make_search_node(vac, "alt_query", "alt_search_response"))
     graph.add_node("charge", make_charge_node(vac))
-    graph.set_entry_point("search")
-    graph.add_edge("search", "charge")
+    # Fan out: both searches start together and share the client's connection pool
+    graph.add_edge(START, "search_a")
+    graph.add_edge(START, "search_b")
+    # Fan in: charge waits for both searches (and their receipts)
+    graph.add_edge(["search_a", "search_b"], "charge")
     graph.add_edge("charge", END)
     app = graph.compile()
 
     initial: State = {
         "query": "flights to NYC",
+        "alt_query": "flights to BOS",
         "amount": 35000,
         "search_response": "",
+        "alt_search_response": "",
         "charge_response": "",
-        "error": "",
+        "errors": [],
     }
-    result = app.invoke(initial)
+    async with vac:
+        result = await app.ainvoke(initial)
     print("Search response:", (result.get("search_response") or "")[:200])
+    print("Alt search response:", (result.get("alt_search_response") or "")[:200])
     print("Charge response:", (result.get("charge_response") or "")[:200])
-    if result.get("error"):
-        print("Error:", result["error"])
+    for error in result.get("errors") or []:
+        print("Error:", error)
     print("Receipts collected:", len(vac.receipts))
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
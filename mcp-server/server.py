@@ -6,9 +6,12 @@ call the sidecar via the Model Context Protocol. Requires sidecar URL and
 root biscuit (env or defaults).
 """
 
+import asyncio
+import functools
 import os
 import sys
-from typing import Any, Optional
+from collections import OrderedDict
+from typing import Any, Optional, Set
 
 # Allow importing vac_client from sibling sdks/python when run from mcp-server/
 _REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
@@ -16,7 +19,7 @@ _sdks_python = os.path.join(_REPO_ROOT, "sdks", "python")
 if _sdks_python not in sys.path:
     sys.path.insert(0, _sdks_python)
 
-from vac_client import VACClient, VACError
+from vac_client import AsyncVACClient, VACError
 
 try:
     from mcp.server.fastmcp import FastMCP
@@ -32,41 +35,73 @@ mcp = FastMCP(
 )
 
 # --------------------------------------------------------------------------
-# Persistent client so receipts accumulate across tool calls
+# Persistent clients so receipts (and pooled connections) survive across
+# tool calls: one per agent-supplied correlation ID, plus a default session
+# (key None). At most _MAX_SESSIONS keyed sessions are kept; the least
+# recently used one is evicted and its connection pool closed. The default
+# session is never evicted.
 # --------------------------------------------------------------------------
-_client: Optional[VACClient] = None
-
-
-def _get_client() -> VACClient:
-    """Return a shared VACClient, creating it on first use."""
-    global _client
-    if _client is None:
-        _client = VACClient(sidecar_url=SIDECAR_URL, root_biscuit=ROOT_BISCUIT)
-    return _client
+_MAX_SESSIONS = 128
+_sessions: "OrderedDict[Optional[str], AsyncVACClient]" = OrderedDict()
+_closing: Set["asyncio.Task[None]"] = set()
+
+
+def _client_for(correlation_id: Optional[str] = None) -> AsyncVACClient:
+    """Return the AsyncVACClient for a correlation ID (None = default session), creating it if needed.
+    Must be called from the event loop (evicted clients are closed in a background task).
+    """
+    client = _sessions.get(correlation_id)
+    if client is not None:
+        _sessions.move_to_end(correlation_id)
+        return client
+    client = AsyncVACClient(
+        sidecar_url=SIDECAR_URL,
+        root_biscuit=ROOT_BISCUIT,
+        correlation_id=correlation_id,
+    )
+    _sessions[correlation_id] = client
+    if len(_sessions) - (None in _sessions) > _MAX_SESSIONS:
+        _evict_oldest_session()
+    return client
+
+
+def _evict_oldest_session() -> None:
+    """Drop the least recently used keyed session and close its connection pool."""
+    oldest = next(key for key in _sessions if key is not None)
+    evicted = _sessions.pop(oldest)
+    task = asyncio.get_running_loop().create_task(evicted.aclose())
+    _closing.add(task)  # keep a reference until the close finishes
+    task.add_done_callback(_closing.discard)
+
+
+# HTTP method -> (client method, keyword the optional body is sent as);
+# anything else goes through client._request with a JSON body
+_METHODS = {
+    "GET": ("get", "params"),
+    "POST": ("post", "json"),
+    "PUT": ("put", "json"),
+    "PATCH": ("patch", "json"),
+    "DELETE": ("delete", "json"),
+}
 
 
 @mcp.tool()
-def vac_request(
+async def vac_request(
     method: str,
     path: str,
     body: Optional[dict] = None,
+    correlation_id: Optional[str] = None,
 ) -> dict:
-    """Send an HTTP request through the VAC sidecar. Method (GET, POST, etc.), path (e.g. /search, /charge), and optional JSON body. Returns status, response body, and whether a receipt was issued."""
+    """Send an HTTP request through the VAC sidecar. Method (GET, POST, etc.), path (e.g. /search, /charge), and optional JSON body. Pass the same correlation_id (a UUID) on every step of a workflow to keep its receipts together; omit it to use the default session. Returns status, response body, and whether a receipt was issued."""
     if not ROOT_BISCUIT:
         return {"ok": False, "error": "VAC_ROOT_BISCUIT not set"}
-    client = _get_client()
+    client = _client_for(correlation_id)
     try:
         method = method.upper()
-        if method == "GET":
-            resp = client.get(path, params=body or None)
-        elif method == "POST":
-            resp = client.post(path, json=body)
-        elif method == "PUT":
-            resp = client.put(path, json=body)
-        elif method == "PATCH":
-            resp = client.patch(path, json=body)
-        else:
-            resp = client._request(method, path, json=body)
+        name, body_arg = _METHODS.get(method, (None, "json"))
+        send = getattr(client, name) if name else functools.partial(client._request, method)
+        # An empty params dict would drop any query string already in path
+        resp = await send(path, **{body_arg: (body or None) if body_arg == "params" else body})
     except VACError as e:
         return {
             "ok": False,
@@ -88,17 +123,18 @@ def vac_request(
 
 
 @mcp.tool()
-def vac_receipts_count() -> dict:
-    """Return the number of receipts the current VAC client session has accumulated."""
-    client = _get_client()
-    return {"receipts_count": len(client.receipts)}
+def vac_receipts_count(correlation_id: Optional[str] = None) -> dict:
+    """Return the number of receipts accumulated for a correlation_id (or the default session if omitted); 0 for unknown sessions."""
+    client = _sessions.get(correlation_id)
+    return {"receipts_count": len(client.receipts) if client is not None else 0}
 
 
 @mcp.tool()
 def vac_clear_receipts() -> dict:
-    """Clear all stored receipts and start a fresh session (new correlation ID). Use between independent workflows."""
-    client = _get_client()
-    client.clear_receipts()
+    """Clear all stored receipts and start a fresh default session (new correlation ID). Use between independent workflows; sessions keyed by correlation_id are reset by switching to a new correlation_id."""
+    client = _sessions.get(None)
+    if client is not None:
+        client.clear_receipts()
     return {"ok": True, "message": "Receipts cleared, new session started."}
 
 
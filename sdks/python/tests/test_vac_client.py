@@ -1,7 +1,17 @@
 import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
+import datetime
 import json
-from vac_client import VACClient, VACResponse, VACError
+import uuid
+from dataclasses import dataclass
+import vac_client
+from vac_client import VACClient, AsyncVACClient, VACResponse, VACError
+
+@dataclass
+class _Point:
+    x: int
+    y: int
+
 
 class TestVACClient(unittest.TestCase):
     def setUp(self):
@@ -14,6 +24,9 @@ class TestVACClient(unittest.TestCase):
         c = VACClient(root_biscuit="x")
         self.assertEqual(c.sidecar_url, "http://localhost:3000")
         self.assertIsNotNone(c.correlation_id)
+        # Sidecar validates X-Correlation-ID as a UUID
+        self.assertEqual(uuid.UUID(c.correlation_id).version, 4)
+        self.assertEqual(str(uuid.UUID(c.correlation_id)), c.correlation_id)
         self.assertEqual(c.receipts, [])
 
     def test_init_custom(self):
@@ -32,18 +45,54 @@ class TestVACClient(unittest.TestCase):
         receipts = [v for k, v in headers if k == "X-VAC-Receipt"]
         self.assertEqual(receipts, ["r1", "r2"])
 
+    def test_build_headers_tracks_receipt_changes(self):
+        self.client.receipts = ["r1"]
+        self.client._build_headers()
+        self.client.receipts.append("r2")
+        receipts = [v for k, v in self.client._build_headers() if k == "X-VAC-Receipt"]
+        self.assertEqual(receipts, ["r1", "r2"])
+
+        self.client.receipts = ["r3"]
+        receipts = [v for k, v in self.client._build_headers() if k == "X-VAC-Receipt"]
+        self.assertEqual(receipts, ["r3"])
+
+        # In-place edit that keeps the length
+        self.client.receipts[0] = "rX"
+        receipts = [v for k, v in self.client._build_headers() if k == "X-VAC-Receipt"]
+        self.assertEqual(receipts, ["rX"])
+
+    def test_clear_receipts_refreshes_correlation_header(self):
+        self.client.receipts = ["r1"]
+        old_cid = self.client.correlation_id
+        self.client.clear_receipts()
+        headers = self.client._build_headers()
+        cid = next(v for k, v in headers if k == "X-Correlation-ID")
+        self.assertNotEqual(cid, old_cid)
+        self.assertEqual(cid, self.client.correlation_id)
+        self.assertEqual([v for k, v in headers if k == "X-VAC-Receipt"], [])
+
+    def test_build_headers_follows_field_changes(self):
+        self.client._build_headers()
+        cid = "11111111-1111-4111-8111-111111111111"
+        self.client.correlation_id = cid
+        self.client.root_biscuit = "b"
+        headers = self.client._build_headers()
+        self.assertIn(("X-Correlation-ID", cid), headers)
+        self.assertIn(("Authorization", "Bearer b"), headers)
+
     def test_build_headers_no_content_type(self):
         headers = self.client._build_headers(include_content_type=False)
         ct = [v for k, v in headers if k == "Content-Type"]
         self.assertEqual(ct, [])
 
+    @unittest.skipIf(vac_client.orjson is None, "orjson not installed")
     @patch("vac_client.httpx")
     def test_request_httpx_json(self, mock_httpx):
         # Setup mock response
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.headers = {}
-        mock_response.text = '{"ok": true}'
+        mock_response.content = b'{"ok": true}'
         
         mock_client_instance = MagicMock()
         mock_client_instance.request.return_value = mock_response
@@ -57,12 +106,77 @@ class TestVACClient(unittest.TestCase):
         self.assertEqual(resp.status_code, 200)
         self.assertEqual(resp.json(), {"ok": True})
         
-        # Verify call args
+        # Verify call args: JSON body is pre-serialized with orjson and sent as content
         mock_client_instance.request.assert_called_once()
+        args, kwargs = mock_client_instance.request.call_args
+        self.assertIsNone(kwargs.get("json"))
+        self.assertEqual(json.loads(kwargs["content"]), {"a": 1})
+        self.assertIn(("Content-Type", "application/json"), kwargs["headers"])
+
+    @unittest.skipIf(vac_client.orjson is None, "orjson not installed")
+    def test_encode_json_falls_back_to_stdlib_path(self):
+        # orjson can't encode 2**70 and is told not to encode datetime/dataclasses;
+        # those bodies go through the HTTP library's json= encoder unchanged
+        for body in ({"n": 2**70}, {"at": datetime.datetime(2024, 1, 1)}, {"d": _Point(1, 2)}):
+            self.assertEqual(VACClient._encode_json(body, None), (body, None))
+        json_arg, content = VACClient._encode_json({1: "a"}, None)
+        self.assertIsNone(json_arg)
+        self.assertEqual(json.loads(content), {"1": "a"})
+
+    @patch("vac_client.orjson", None)
+    @patch("vac_client.httpx")
+    def test_request_httpx_json_without_orjson(self, mock_httpx):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.content = b""
+
+        mock_client_instance = MagicMock()
+        mock_client_instance.request.return_value = mock_response
+        mock_httpx.Client.return_value = mock_client_instance
+
+        self.client.post("/test", json={"a": 1})
+
         args, kwargs = mock_client_instance.request.call_args
         self.assertEqual(kwargs["json"], {"a": 1})
         self.assertIsNone(kwargs.get("content"))  # Should not pass content when json is used
 
+    @patch("vac_client.httpx")
+    def test_http_client_reused_and_closed(self, mock_httpx):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.content = b""
+
+        mock_client_instance = MagicMock()
+        mock_client_instance.request.return_value = mock_response
+        mock_httpx.Client.return_value = mock_client_instance
+
+        with self.client as c:
+            c.get("/a")
+            c.get("/b")
+
+        # One pooled client for both requests, closed on exit
+        mock_httpx.Client.assert_called_once()
+        _, client_kwargs = mock_httpx.Client.call_args
+        self.assertEqual(client_kwargs["http2"], vac_client.HTTP2_AVAILABLE)
+        self.assertEqual(mock_client_instance.request.call_count, 2)
+        mock_client_instance.close.assert_called_once()
+
+    @patch("vac_client.httpx")
+    def test_response_headers_not_copied(self, mock_httpx):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"X-Test": "1"}
+        mock_response.content = b""
+
+        mock_client_instance = MagicMock()
+        mock_client_instance.request.return_value = mock_response
+        mock_httpx.Client.return_value = mock_client_instance
+
+        resp = self.client.get("/test")
+        self.assertIs(resp.headers, mock_response.headers)
+
     def test_receipt_extraction(self):
         # Test that receipt header is extracted and added to self.receipts
         with patch("vac_client.httpx") as mock_httpx:
@@ -70,7 +184,7 @@ class TestVACClient(unittest.TestCase):
             mock_resp.status_code = 200
             # Mock headers.get behavior
             mock_resp.headers.get.side_effect = lambda k: "new-receipt" if k.lower() == "x-vac-receipt" else None
-            mock_resp.text = ""
+            mock_resp.content = b""
             
             mock_client = MagicMock()
             mock_client.request.return_value = mock_resp
@@ -96,12 +210,78 @@ class TestVACClient(unittest.TestCase):
         err4 = VACError(409, "Correlation mismatch")
         self.assertTrue(err4.is_correlation_mismatch)
 
+        # Message hints only count on 403
+        err5 = VACError(500, "prior_event store expired")
+        self.assertFalse(err5.is_missing_receipt)
+        self.assertFalse(err5.is_expired)
+        self.assertFalse(err5.is_policy_violation)
+        self.assertFalse(err3.is_missing_receipt)
+
     def test_response_json_empty(self):
-        resp = VACResponse(200, {}, "")
+        resp = VACResponse(200, {}, b"")
         self.assertIsNone(resp.json())
         
-        resp2 = VACResponse(200, {}, "{}")
+        resp2 = VACResponse(200, {}, b"{}")
         self.assertEqual(resp2.json(), {})
 
+    def test_response_text_decoded_lazily(self):
+        resp = VACResponse(403, {}, "prior step required \u2713".encode())
+        self.assertIsNone(resp._text)
+        self.assertEqual(resp.text, "prior step required \u2713")
+        self.assertIs(resp.text, resp.text)  # cached
+        with self.assertRaises(VACError) as ctx:
+            resp.raise_for_status()
+        self.assertTrue(ctx.exception.is_missing_receipt)
+
+    def test_response_json_stdlib_fallback(self):
+        resp = VACResponse(200, {}, b'{"a": [1, 2]}')
+        with patch("vac_client.orjson", None):
+            self.assertEqual(resp.json(), {"a": [1, 2]})
+            with self.assertRaises(json.JSONDecodeError):
+                VACResponse(200, {}, b"not json").json()
+
+    def test_response_json_matches_stdlib(self):
+        # Wide integers, non-finite and out-of-range numbers parse exactly as json.loads does
+        for body in (
+            b'{"n": 12345678901234567890123}',
+            b'{"n": -9223372036854775809}',
+            b'{"n": 18446744073709551616}',
+            b'[NaN, Infinity, -Infinity]',
+            b'[1e400]',
+        ):
+            expected = json.loads(body)
+            got = VACResponse(200, {}, body).json()
+            self.assertEqual(repr(got), repr(expected), body)
+        self.assertEqual(VACResponse(200, {}, b'{"n": 12345678901234567890123}').json()["n"], 12345678901234567890123)
+
+    def test_response_json_invalid_raises_jsondecodeerror(self):
+        with self.assertRaises(json.JSONDecodeError):
+            VACResponse(200, {}, b"not json").json()
+
+class TestAsyncVACClient(unittest.IsolatedAsyncioTestCase):
+    async def test_request_accumulates_receipts(self):
+        with patch("vac_client.httpx") as mock_httpx:
+            mock_resp = MagicMock()
+            mock_resp.status_code = 200
+            mock_resp.headers.get.side_effect = lambda k: "async-receipt" if k.lower() == "x-vac-receipt" else None
+            mock_resp.content = b'{"ok": true}'
+
+            mock_client = MagicMock()
+            mock_client.request = AsyncMock(return_value=mock_resp)
+            mock_client.aclose = AsyncMock()
+            mock_httpx.AsyncClient.return_value = mock_client
+
+            async with AsyncVACClient(root_biscuit="test-root-biscuit") as vac:
+                resp = await vac.post("/search", json={"q": "x"})
+                self.assertEqual(resp.json(), {"ok": True})
+                await vac.post("/charge", json={"amount": 1})
+
+            self.assertEqual(vac.receipts, ["async-receipt", "async-receipt"])
+            # Second request carries the receipt from the first
+            _, kwargs = mock_client.request.call_args
+            self.assertIn(("X-VAC-Receipt", "async-receipt"), kwargs["headers"])
+            mock_httpx.AsyncClient.assert_called_once()
+            mock_client.aclose.assert_awaited_once()
+
 if __name__ == "__main__":
     unittest.main()
@@ -14,10 +14,17 @@ Usage:
     # Make requests - receipts auto-accumulate
     response = vac.get("/search", params={"q": "flights"})
     response = vac.post("/charge", json={"amount": 100})
+
+    # Async frameworks (LangGraph, MCP): same API, awaitable
+    async with AsyncVACClient(root_biscuit="<your-biscuit-token>") as vac:
+        response = await vac.get("/search", params={"q": "flights"})
 """
 
-import uuid
-from typing import Optional, List, Dict, Any
+import json
+import os
+import re
+import warnings
+from typing import Optional, List, Dict, Any, Mapping
 from dataclasses import dataclass, field
 
 try:
@@ -27,22 +34,90 @@ except ImportError:
     import requests
     USE_HTTPX = False
 
+try:
+    import orjson
+    # Match the stdlib: int dict keys allowed; datetime/dataclasses not encoded
+    _ORJSON_DUMPS_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+except ImportError:
+    orjson = None
+
+try:
+    import h2  # noqa: F401 -- httpx needs it for HTTP/2 (pip install httpx[http2])
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+_CONTENT_TYPE_HEADER = ("Content-Type", "application/json")
+
+# orjson turns integers outside the 64-bit range into floats (losing digits);
+# any run of 19+ digits routes the body to the stdlib parser instead
+_WIDE_INT = re.compile(rb"\d{19}")
+
+
+def _httpx_options() -> Dict[str, Any]:
+    """Shared httpx client settings for VACClient and AsyncVACClient.
+    HTTP/2 (when h2 is installed) multiplexes a workflow's requests over one
+    connection to an https sidecar; plain http sidecars stay on HTTP/1.1 keep-alive.
+    Idle connections are kept for 85s so the pool stays warm between workflow
+    steps, which also means DNS is only resolved when a new connection opens.
+    """
+    return {
+        "timeout": 30.0,
+        "limits": httpx.Limits(
+            max_keepalive_connections=64,
+            max_connections=128,
+            keepalive_expiry=85.0,
+        ),
+        "http2": HTTP2_AVAILABLE,
+    }
+
+
+def _new_correlation_id() -> str:
+    """Random RFC 4122 v4 UUID string, built from os.urandom without uuid.UUID."""
+    b = bytearray(os.urandom(16))
+    b[6] = (b[6] & 0x0F) | 0x40  # version 4
+    b[8] = (b[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
 
 @dataclass
 class VACResponse:
     """Response from VAC sidecar.
-    Note: headers is a single-value-per-name dict; duplicate header names in the
-    raw response collapse to one value (use the receipt field for X-VAC-Receipt).
+    The body is kept as raw bytes (content); text is decoded lazily on access.
+    Note: headers is the underlying client's case-insensitive mapping (httpx.Headers
+    or requests' CaseInsensitiveDict), not a copy; duplicate header names may be
+    joined into one value (use the receipt field for X-VAC-Receipt).
     """
     status_code: int
-    headers: Dict[str, str]
-    text: str
+    headers: Mapping[str, str]
+    content: bytes
     receipt: Optional[str] = None
+    _text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    @property
+    def text(self) -> str:
+        """Response body decoded as UTF-8; decoded on first access and cached."""
+        if self._text is None:
+            self._text = self.content.decode("utf-8", errors="replace")
+        return self._text
     
     def json(self) -> Any:
-        """Parse response body as JSON. Returns None if body is empty; raises json.JSONDecodeError if not valid JSON."""
-        import json
-        return json.loads(self.text) if self.text else None
+        """Parse response body as JSON. Returns None if body is empty; raises json.JSONDecodeError if not valid JSON.
+        Parses the raw bytes (no text decode), using orjson when installed. Results
+        always match the stdlib: bodies with integers wider than 64 bits, or that
+        orjson rejects (NaN, Infinity, out-of-range floats), are parsed by json.loads.
+        """
+        if not self.content:
+            return None
+        if orjson is not None and not _WIDE_INT.search(self.content):
+            try:
+                return orjson.loads(self.content)
+            except orjson.JSONDecodeError:
+                pass
+        return json.loads(self.content)
     
     @property
     def ok(self) -> bool:
@@ -53,6 +128,11 @@ class VACResponse:
             raise VACError(self.status_code, self.text)
 
 
+# VACError classification bits, computed once from the status and message
+_MISSING_RECEIPT = 1
+_EXPIRED = 2
+
+
 class VACError(Exception):
     """Error from VAC sidecar."""
     
@@ -60,6 +140,12 @@ class VACError(Exception):
         self.status_code = status_code
         self.message = message
         super().__init__(f"VAC Error {status_code}: {message}")
+        self._flags = 0
+        if status_code == 403:
+            if "prior_event" in message or "prior step" in message:
+                self._flags |= _MISSING_RECEIPT
+            if "expired" in message.lower():
+                self._flags |= _EXPIRED
     
     @property
     def is_policy_violation(self) -> bool:
@@ -67,13 +153,11 @@ class VACError(Exception):
     
     @property
     def is_missing_receipt(self) -> bool:
-        return self.status_code == 403 and (
-            "prior_event" in self.message or "prior step" in self.message
-        )
+        return bool(self._flags & _MISSING_RECEIPT)
     
     @property
     def is_expired(self) -> bool:
-        return self.status_code == 403 and "expired" in self.message.lower()
+        return bool(self._flags & _EXPIRED)
     
     @property
     def is_correlation_mismatch(self) -> bool:
@@ -81,89 +165,155 @@ class VACError(Exception):
 
 
 @dataclass
-class VACClient:
-    """
-    VAC Protocol client for Python.
-    
-    Handles:
-    - Authorization header with Root Biscuit
-    - Correlation ID tracking
-    - Receipt accumulation for multi-step workflows
-    - Multiple X-VAC-Receipt headers
-    
-    Args:
-        sidecar_url: URL of the VAC sidecar (default: http://localhost:3000)
-        root_biscuit: Base64-encoded Root Biscuit token
-        correlation_id: Optional correlation ID (auto-generated if not provided)
-    """
+class _BaseVACClient:
+    """Shared state and header/receipt handling for the sync and async clients."""
     sidecar_url: str = "http://localhost:3000"
     root_biscuit: str = ""
     correlation_id: Optional[str] = None
     receipts: List[str] = field(default_factory=list)
+    _http: Any = field(default=None, init=False, repr=False, compare=False)
+    _base_headers: tuple = field(default=(), init=False, repr=False, compare=False)
+    _base_src: tuple = field(default=(None, None), init=False, repr=False, compare=False)
+    _receipt_headers: List[tuple] = field(default_factory=list, init=False, repr=False, compare=False)
+    _receipts_snapshot: List[str] = field(default_factory=list, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         self.sidecar_url = self.sidecar_url.rstrip("/")
         if self.correlation_id is None:
-            self.correlation_id = str(uuid.uuid4())
+            self.correlation_id = _new_correlation_id()
     
     def _build_headers(self, include_content_type: bool = True) -> List[tuple]:
         """Build headers list (supports multiple same-name headers)."""
-        headers = [
-            ("Authorization", f"Bearer {self.root_biscuit}"),
-            ("X-Correlation-ID", self.correlation_id),
-        ]
+        # Auth/correlation headers are cached, and rebuilt whenever root_biscuit
+        # or correlation_id has been reassigned since they were built
+        biscuit, cid = self._base_src
+        if biscuit is not self.root_biscuit or cid is not self.correlation_id:
+            self._base_headers = (
+                ("Authorization", f"Bearer {self.root_biscuit}"),
+                ("X-Correlation-ID", self.correlation_id),
+            )
+            self._base_src = (self.root_biscuit, self.correlation_id)
+        headers = list(self._base_headers)
         if include_content_type:
-            headers.append(("Content-Type", "application/json"))
-        for receipt in self.receipts:
-            headers.append(("X-VAC-Receipt", receipt))
+            headers.append(_CONTENT_TYPE_HEADER)
+        # Receipt header tuples are appended as receipts arrive; rebuild only if
+        # `receipts` no longer matches the snapshot they were built from (replaced
+        # or edited outside the client). The list compare is a C-level scan that
+        # short-circuits on identical items, far cheaper than rebuilding tuples.
+        if self.receipts != self._receipts_snapshot:
+            self._receipt_headers = [("X-VAC-Receipt", r) for r in self.receipts]
+            self._receipts_snapshot = list(self.receipts)
+        headers.extend(self._receipt_headers)
         return headers
     
-    def _request(
-        self,
-        method: str,
-        path: str,
-        params: Optional[Dict] = None,
-        json: Optional[Any] = None,
-        data: Optional[Any] = None,
-    ) -> VACResponse:
-        """Make a request through the VAC sidecar.
-        Provide only one of json or data per request; if both are set, json is used.
+    def _prepare_request(self, method: str, path: str, json: Optional[Any], data: Optional[Any]):
+        """Return (url, headers) for a request.
         Content-Type: application/json is sent only when the request has a body (non-GET or json/data provided).
         """
         path = path if path.startswith("/") else f"/{path}"
         url = f"{self.sidecar_url}{path}"
         has_body = json is not None or data is not None
         include_content_type = method.upper() != "GET" or has_body
-        headers = self._build_headers(include_content_type=include_content_type)
-        
-        if USE_HTTPX:
-            response = self._request_httpx(method, url, headers, params, json, data)
-        else:
-            response = self._request_requests(method, url, headers, params, json, data)
-        
-        # Store new receipt if present
+        return url, self._build_headers(include_content_type=include_content_type)
+    
+    @staticmethod
+    def _encode_json(json: Optional[Any], data: Optional[Any]):
+        """Return (json, data) to send, pre-serializing the JSON body with orjson when installed.
+        Content-Type is already set by _build_headers, so the body goes out as raw content.
+        Bodies orjson can't encode (integers wider than 64 bits) or that the stdlib would
+        reject (datetime, dataclasses) fall back to the HTTP library's json= encoder.
+        orjson still differs for uuid.UUID and Enum values (encoded, not rejected) and
+        NaN/Infinity (sent as null).
+        """
+        if json is not None and orjson is not None:
+            try:
+                return None, orjson.dumps(json, option=_ORJSON_DUMPS_OPTIONS)
+            except orjson.JSONEncodeError:
+                pass
+        return json, data
+    
+    def _handle_response(self, response) -> VACResponse:
+        """Store any new receipt and wrap the raw response."""
         receipt = response.headers.get("X-VAC-Receipt") or response.headers.get("x-vac-receipt")
         if receipt:
             self.receipts.append(receipt)
+            self._receipts_snapshot.append(receipt)
+            self._receipt_headers.append(("X-VAC-Receipt", receipt))
         
         return VACResponse(
             status_code=response.status_code,
-            headers=dict(response.headers),
-            text=response.text,
+            headers=response.headers,
+            content=response.content,
             receipt=receipt,
         )
     
+    def clear_receipts(self) -> None:
+        """Clear stored receipts and generate new correlation ID."""
+        self.receipts = []
+        self._receipt_headers = []
+        self._receipts_snapshot = []
+        self.correlation_id = _new_correlation_id()
+
+
+@dataclass
+class VACClient(_BaseVACClient):
+    """
+    VAC Protocol client for Python.
+    
+    Handles:
+    - Authorization header with Root Biscuit
+    - Correlation ID tracking
+    - Receipt accumulation for multi-step workflows
+    - Multiple X-VAC-Receipt headers
+    
+    Args:
+        sidecar_url: URL of the VAC sidecar (default: http://localhost:3000)
+        root_biscuit: Base64-encoded Root Biscuit token
+        correlation_id: Optional correlation ID (auto-generated if not provided)
+    """
+    
+    def __post_init__(self):
+        super().__post_init__()
+        # HTTP backend is fixed at import time; bind it once instead of branching per request
+        self._do_http = self._request_httpx if USE_HTTPX else self._request_requests
+    
+    def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict] = None,
+        json: Optional[Any] = None,
+        data: Optional[Any] = None,
+    ) -> VACResponse:
+        """Make a request through the VAC sidecar.
+        Provide only one of json or data per request; if both are set, json is used.
+        """
+        url, headers = self._prepare_request(method, path, json, data)
+        json, data = self._encode_json(json, data)
+        response = self._do_http(method, url, headers, params, json, data)
+        return self._handle_response(response)
+    
+    def _get_http(self):
+        """Return the pooled HTTP session, creating it on first use.
+        Reusing one session keeps connections alive across workflow steps.
+        """
+        if self._http is None:
+            if USE_HTTPX:
+                self._http = httpx.Client(**_httpx_options())
+            else:
+                self._http = requests.Session()
+        return self._http
+    
     def _request_httpx(self, method, url, headers, params, json_data, data):
         """Make request using httpx (supports multiple same-name headers)."""
-        with httpx.Client(timeout=30.0) as client:
-            return client.request(
-                method,
-                url,
-                headers=headers,
-                params=params,
-                json=json_data if json_data is not None else None,
-                content=data if json_data is None else None,
-            )
+        return self._get_http().request(
+            method,
+            url,
+            headers=headers,
+            params=params,
+            json=json_data if json_data is not None else None,
+            content=data if json_data is None else None,
+        )
     
     def _request_requests(self, method, url, headers, params, json_data, data):
         """Make request using requests library.
@@ -173,7 +323,6 @@ class VACClient:
         multi-step workflows (search -> select -> charge).
         """
         if len(self.receipts) > 1:
-            import warnings
             warnings.warn(
                 "Multiple receipts with 'requests' library: sidecar expects separate "
                 "X-VAC-Receipt headers. Multi-step workflows may fail. Install httpx.",
@@ -187,7 +336,7 @@ class VACClient:
             else:
                 headers_dict[k] = v
 
-        return requests.request(
+        return self._get_http().request(
             method,
             url,
             headers=headers_dict,
@@ -217,10 +366,17 @@ class VACClient:
         """DELETE request through VAC sidecar."""
         return self._request("DELETE", path, **kwargs)
     
-    def clear_receipts(self) -> None:
-        """Clear stored receipts and generate new correlation ID."""
-        self.receipts = []
-        self.correlation_id = str(uuid.uuid4())
+    def close(self) -> None:
+        """Close pooled connections. The client reconnects if used again."""
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+    
+    def __enter__(self) -> "VACClient":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
     
     def new_workflow(self) -> "VACClient":
         """Create a new client instance for a fresh workflow."""
@@ -230,6 +386,95 @@ class VACClient:
         )
 
 
+@dataclass
+class AsyncVACClient(_BaseVACClient):
+    """
+    Async VAC Protocol client built on httpx.AsyncClient.
+    
+    Same behaviour as VACClient, but requests are coroutines so async
+    frameworks (LangGraph, MCP) can overlap sidecar round-trips without
+    blocking the event loop. Requires httpx.
+    
+    Args:
+        sidecar_url: URL of the VAC sidecar (default: http://localhost:3000)
+        root_biscuit: Base64-encoded Root Biscuit token
+        correlation_id: Optional correlation ID (auto-generated if not provided)
+    """
+    
+    def __post_init__(self):
+        if not USE_HTTPX:
+            raise ImportError("AsyncVACClient requires httpx: pip install httpx")
+        super().__post_init__()
+    
+    def _get_http(self):
+        """Return the pooled async HTTP client, creating it on first use."""
+        if self._http is None:
+            self._http = httpx.AsyncClient(**_httpx_options())
+        return self._http
+    
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict] = None,
+        json: Optional[Any] = None,
+        data: Optional[Any] = None,
+    ) -> VACResponse:
+        """Make a request through the VAC sidecar.
+        Provide only one of json or data per request; if both are set, json is used.
+        """
+        url, headers = self._prepare_request(method, path, json, data)
+        json, data = self._encode_json(json, data)
+        response = await self._get_http().request(
+            method,
+            url,
+            headers=headers,
+            params=params,
+            json=json if json is not None else None,
+            content=data if json is None else None,
+        )
+        return self._handle_response(response)
+    
+    async def get(self, path: str, **kwargs) -> VACResponse:
+        """GET request through VAC sidecar."""
+        return await self._request("GET", path, **kwargs)
+    
+    async def post(self, path: str, **kwargs) -> VACResponse:
+        """POST request through VAC sidecar."""
+        return await self._request("POST", path, **kwargs)
+    
+    async def put(self, path: str, **kwargs) -> VACResponse:
+        """PUT request through VAC sidecar."""
+        return await self._request("PUT", path, **kwargs)
+    
+    async def patch(self, path: str, **kwargs) -> VACResponse:
+        """PATCH request through VAC sidecar."""
+        return await self._request("PATCH", path, **kwargs)
+    
+    async def delete(self, path: str, **kwargs) -> VACResponse:
+        """DELETE request through VAC sidecar."""
+        return await self._request("DELETE", path, **kwargs)
+    
+    async def aclose(self) -> None:
+        """Close pooled connections. The client reconnects if used again."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+    
+    async def __aenter__(self) -> "AsyncVACClient":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+    
+    def new_workflow(self) -> "AsyncVACClient":
+        """Create a new client instance for a fresh workflow."""
+        return AsyncVACClient(
+            sidecar_url=self.sidecar_url,
+            root_biscuit=self.root_biscuit,
+        )
+
+
 # Convenience function
 def create_client(
     sidecar_url: str = "http://localhost:3000",